@@ -59,7 +59,7 @@ parser = BrainLinkParser(
 )
 
 def handle(_, data: bytearray):
-    parser.parse(bytes(data))
+    parser.parse(data)
 
 
 # =======================
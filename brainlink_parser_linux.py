@@ -1,16 +1,27 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Callable, Optional, Dict, Any, Tuple
+from typing import Callable, Optional, Dict, DefaultDict, Any, Iterator, Mapping, Tuple, Union
 import struct
 import time
 from collections import defaultdict
 
+_time_monotonic = time.monotonic
+
+# ThinkGear: PLENGTH above 169 is invalid
+_MAX_PAYLOAD = 169
+
+# Precompiled struct formats
+_S_H = struct.Struct(">h")
+_S_HHH = struct.Struct(">hhh")
+# ASIC_EEG_POWER: 8 x uint24 big-endian, read as (hi16, lo8) pairs
+_S_EEG_POWER = struct.Struct(">" + "HB" * 8)
+
 
 # =======================
 # Public API data objects
 # =======================
 
-@dataclass
+@dataclass(slots=True)
 class BrainLinkData:
     signal: int = 0
     attention: int = 0
@@ -26,7 +37,7 @@ class BrainLinkData:
     highGamma: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class BrainLinkExtendData:
     battery: Optional[int] = None          # %
     temperature: Optional[float] = None    # °C
@@ -36,7 +47,37 @@ class BrainLinkExtendData:
     rr: Optional[Tuple[int, int, int]] = None
     version: Optional[str] = None
 
-    unknown: Dict[str, Any] = field(default_factory=dict)
+    unknown: Mapping[str, Dict[str, Any]] = field(default_factory=dict)
+
+
+class _UnknownStatsView(Mapping[str, Dict[str, Any]]):
+    # Read-only view over the parser's raw unknown-code stats
+    # ({"count", "len_mask", "last": bytes}); entries are rendered as
+    # {"count", "lens": set, "last": hex} only when read.
+    __slots__ = ("_stats",)
+
+    def __init__(self, stats: Dict[str, Dict[str, Any]]) -> None:
+        self._stats = stats
+
+    def __getitem__(self, key: str) -> Dict[str, Any]:
+        if key not in self._stats:  # don't let defaultdict create it
+            raise KeyError(key)
+        stat = self._stats[key]
+        mask = stat["len_mask"]
+        return {
+            "count": stat["count"],
+            "lens": {n for n in range(mask.bit_length()) if mask >> n & 1},
+            "last": stat["last"].hex(),
+        }
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._stats)
+
+    def __len__(self) -> int:
+        return len(self._stats)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
 
 
 # =======================
@@ -52,7 +93,7 @@ class BrainLinkParser:
         rr_callback: Optional[Callable[[int, int, int], None]] = None,
         raw_callback: Optional[Callable[[int], None]] = None,
         debug: bool = False,
-    ):
+    ) -> None:
         self.eeg_callback = eeg_callback
         self.eeg_extend_callback = eeg_extend_callback
         self.gyro_callback = gyro_callback
@@ -60,24 +101,26 @@ class BrainLinkParser:
         self.raw_callback = raw_callback
         self.debug = debug
 
-        self._buf = bytearray()
-        self._eeg = BrainLinkData()
-        self._ext = BrainLinkExtendData()
+        self._buf: bytearray = bytearray()
+        self._pos: int = 0  # read cursor into _buf
+        self._eeg: BrainLinkData = BrainLinkData()
+        self._ext: BrainLinkExtendData = BrainLinkExtendData()
 
-        self._last_eeg_snapshot = None
-        self._last_ext_snapshot = None
+        self._last_eeg_snapshot: Optional[Tuple[int, ...]] = None
+        self._last_ext_snapshot: Optional[Tuple[Any, ...]] = None
 
         # EXT throttling
-        self._last_ext_emit_time = 0.0
-        self._ext_emit_interval = 3.0  # seconds
+        self._last_ext_emit_time: float = float("-inf")
+        self._ext_emit_interval: float = 3.0  # seconds
 
-        self._unknown_stats = defaultdict(lambda: {"count": 0, "lens": set(), "last": None})
+        self._unknown_stats: DefaultDict[str, Dict[str, Any]] = defaultdict(lambda: {"count": 0, "len_mask": 0, "last": None})
+        self._ext.unknown = _UnknownStatsView(self._unknown_stats)
 
     # =========
     # Public
     # =========
 
-    def parse(self, data: bytes):
+    def parse(self, data: Union[bytes, bytearray, memoryview]) -> None:
         if not data:
             return
         self._buf.extend(data)
@@ -95,55 +138,94 @@ class BrainLinkParser:
     def _extract_packet(self) -> Optional[bytes]:
         b = self._buf
 
-        while len(b) >= 2 and not (b[0] == 0xAA and b[1] == 0xAA):
-            del b[0]
-
-        if len(b) < 4:
-            return None
-
-        length = b[2]
-        total = 3 + length + 1
-        if len(b) < total:
-            return None
+        # compact consumed prefix only occasionally
+        if self._pos > 4096:
+            del b[:self._pos]
+            self._pos = 0
 
-        payload = bytes(b[3:3 + length])
-        checksum = b[3 + length]
-
-        if ((sum(payload) & 0xFF) + checksum) & 0xFF != 0xFF:
-            del b[0]
-            return None
+        # rejected headers/frames resume the scan one byte further on
+        while True:
+            sync = b.find(b"\xAA\xAA", self._pos)
+            if sync == -1:
+                # no sync anywhere: skip it all in one go, except an
+                # unconsumed trailing AA that may start the next AA AA;
+                # the compaction above frees the bytes later
+                end = len(b)
+                if end > self._pos and b[-1] == 0xAA:
+                    end -= 1
+                self._pos = end
+                return None
+            self._pos = p = sync
+
+            if len(b) - p < 4:
+                return None
+
+            length = b[p + 2]
+            if length > _MAX_PAYLOAD:
+                # not a real header (0xAA here is just another sync byte)
+                self._pos = p + 1
+                continue
+            total = 3 + length + 1
+            if len(b) - p < total:
+                return None
+
+            checksum = b[p + 3 + length]
+            # validate in place; copy the payload out only for good frames
+            with memoryview(b)[p + 3:p + 3 + length] as body:
+                good = (sum(body) + checksum) & 0xFF == 0xFF
+                payload = body.tobytes() if good else None
+            if payload is None:
+                self._pos = p + 1
+                continue
 
-        del b[:total]
-        return payload
+            self._pos = p + total
+            return payload
 
     # =========
     # Payload parsing
     # =========
 
-    def _parse_payload(self, payload: bytes):
+    def _parse_payload(self, payload: bytes) -> None:
+        n = len(payload)
+
+        # raw wave (80 02 hi lo) is ~512 packets/s and always alone in
+        # its payload: decode it directly instead of walking the codes
+        if n == 4 and payload[0] == 0x80 and payload[1] == 0x02:
+            if self.raw_callback:
+                self.raw_callback(_S_H.unpack_from(payload, 2)[0])
+            self._emit_ext_if_changed(False)
+            return
+
         i = 0
         eeg_updated = False
         ext_updated = False
 
-        while i < len(payload):
+        # bound once per payload, not per code
+        handle_short = self._handle_short
+        handle_long = self._handle_long
+        handle_extend = self._handle_extend
+        # nobody consumes extend data -> skip decoding it
+        decode_ext = bool(self.eeg_extend_callback or self.gyro_callback or self.rr_callback)
+
+        while i < n:
             code = payload[i]
             i += 1
 
+            if i >= n:
+                break
+
             if code < 0x80:
-                if i >= len(payload):
-                    break
                 val = payload[i]
                 i += 1
-                eeg_updated |= self._handle_short(code, val)
+                eeg_updated |= handle_short(code, val)
             else:
-                if i >= len(payload):
-                    break
                 size = payload[i]
                 i += 1
                 block = payload[i:i + size]
                 i += size
-                eeg_updated |= self._handle_long(code, block)
-                ext_updated |= self._handle_extend(code, block)
+                eeg_updated |= handle_long(code, block)
+                if decode_ext:
+                    ext_updated |= handle_extend(code, block)
 
         self._emit_eeg_if_changed(eeg_updated)
         self._emit_ext_if_changed(ext_updated)
@@ -166,23 +248,21 @@ class BrainLinkParser:
 
     def _handle_long(self, code: int, data: bytes) -> bool:
         if code == 0x80 and len(data) == 2:
-            raw = struct.unpack(">h", data)[0]
             if self.raw_callback:
-                self.raw_callback(raw)
+                self.raw_callback(_S_H.unpack_from(data)[0])
             return False
 
         if code == 0x83 and len(data) == 24:
-            vals = [int.from_bytes(data[i:i+3], "big") for i in range(0, 24, 3)]
-            (
-                self._eeg.delta,
-                self._eeg.theta,
-                self._eeg.lowAlpha,
-                self._eeg.highAlpha,
-                self._eeg.lowBeta,
-                self._eeg.highBeta,
-                self._eeg.lowGamma,
-                self._eeg.highGamma,
-            ) = vals
+            v = _S_EEG_POWER.unpack_from(data)
+            e = self._eeg
+            e.delta = (v[0] << 8) | v[1]
+            e.theta = (v[2] << 8) | v[3]
+            e.lowAlpha = (v[4] << 8) | v[5]
+            e.highAlpha = (v[6] << 8) | v[7]
+            e.lowBeta = (v[8] << 8) | v[9]
+            e.highBeta = (v[10] << 8) | v[11]
+            e.lowGamma = (v[12] << 8) | v[13]
+            e.highGamma = (v[14] << 8) | v[15]
             return True
 
         return False
@@ -198,38 +278,34 @@ class BrainLinkParser:
 
         # gyro: 3 x int16
         if len(data) == 6:
-            x, y, z = struct.unpack(">hhh", data)
+            x, y, z = _S_HHH.unpack_from(data)
             self._ext.gyro = (x, y, z)
             if self.gyro_callback:
                 self.gyro_callback(x, y, z)
             return True
 
-        # heart rate
+        # 2 bytes: heart rate, else temperature
         if len(data) == 2:
-            v = int.from_bytes(data, "big")
+            v = (data[0] << 8) | data[1]
             if 40 <= v <= 200:
                 self._ext.heart = v
                 return True
+            t = v / 10.0
+            if 20.0 <= t <= 45.0:
+                self._ext.temperature = t
+                return True
 
         # battery
         if len(data) == 1 and data[0] <= 100:
             self._ext.battery = data[0]
             return True
 
-        # temperature
-        if len(data) == 2:
-            t = int.from_bytes(data, "big") / 10.0
-            if 20.0 <= t <= 45.0:
-                self._ext.temperature = t
-                return True
-
         # unknown (kept but not spammed)
         key = f"0x{code:02X}"
         stat = self._unknown_stats[key]
         stat["count"] += 1
-        stat["lens"].add(len(data))
-        stat["last"] = data.hex()
-        self._ext.unknown[key] = dict(stat)
+        stat["len_mask"] |= 1 << len(data)
+        stat["last"] = data
 
         return False
 
@@ -237,10 +313,15 @@ class BrainLinkParser:
     # Emit logic
     # =========
 
-    def _emit_eeg_if_changed(self, updated: bool):
+    def _emit_eeg_if_changed(self, updated: bool) -> None:
         if not updated or not self.eeg_callback:
             return
-        snap = self._eeg.__dict__.copy()
+        e = self._eeg
+        snap = (
+            e.signal, e.attention, e.meditation,
+            e.delta, e.theta, e.lowAlpha, e.highAlpha,
+            e.lowBeta, e.highBeta, e.lowGamma, e.highGamma,
+        )
         if snap != self._last_eeg_snapshot:
             self._last_eeg_snapshot = snap
             self.eeg_callback(self._eeg)
@@ -267,15 +348,16 @@ class BrainLinkParser:
     #         self._last_ext_emit_time = now
     #         self.eeg_extend_callback(self._ext)
 
-    def _emit_ext_if_changed(self, ext_packet_seen: bool):
+    def _emit_ext_if_changed(self, ext_packet_seen: bool) -> None:
         if not self.eeg_extend_callback:
             return
 
-        now = time.time()
+        now = _time_monotonic()
         if now - self._last_ext_emit_time < self._ext_emit_interval:
             return
 
-        snap = self._ext.__dict__.copy()
+        x = self._ext
+        snap = (x.battery, x.temperature, x.heart, x.gyro, x.rr, x.version)
 
         if ext_packet_seen or snap != self._last_ext_snapshot:
             self._last_ext_snapshot = snap
@@ -1,12 +1,12 @@
 import asyncio
 import time
 import threading
-import queue
+from collections import deque
 import signal
 import subprocess
 import os
-from collections import deque
 
+import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
 from bleak import BleakClient
@@ -27,7 +27,7 @@ RX_UUID = "6e400003-b5a3-f393-e0a9-e50e24dcca9e"
 # =======================
 
 stop_event = threading.Event()
-eeg_queue = queue.Queue()
+eeg_queue = deque(maxlen=10_000)
 
 # =======================
 # Music control (biofeedback)
@@ -65,7 +65,7 @@ def stop_music():
 # =======================
 
 def onEEG(d):
-    eeg_queue.put((time.time(), d.attention, d.meditation))
+    eeg_queue.append((time.time(), d.attention, d.meditation))
 
     with _music_lock:
         if d.meditation >= MED_ON:
@@ -76,7 +76,7 @@ def onEEG(d):
 parser = BrainLinkParser(eeg_callback=onEEG)
 
 def handle(_, data: bytearray):
-    parser.parse(bytes(data))
+    parser.parse(data)
 
 # =======================
 # BLE loop (async, stoppable)
@@ -104,9 +104,30 @@ def ble_thread():
 
 WINDOW_SEC = 60
 
-times = deque(maxlen=WINDOW_SEC * 10)
-att = deque(maxlen=WINDOW_SEC * 10)
-med = deque(maxlen=WINDOW_SEC * 10)
+BUF_LEN = WINDOW_SEC * 10
+
+# fixed-size sample window, oldest first; buf_n = filled length
+buf_t = np.empty(BUF_LEN, dtype=np.float64)
+buf_att = np.empty(BUF_LEN, dtype=np.int16)
+buf_med = np.empty(BUF_LEN, dtype=np.int16)
+buf_n = 0
+
+# append (t, att, med) rows; the oldest fall off when full
+def push_samples(items):
+    global buf_n
+    arr = np.asarray(items, dtype=np.float64)[-BUF_LEN:]
+    n = len(arr)
+    drop = buf_n + n - BUF_LEN
+    if drop > 0:
+        keep = buf_n - drop
+        buf_t[:keep] = buf_t[drop:buf_n]
+        buf_att[:keep] = buf_att[drop:buf_n]
+        buf_med[:keep] = buf_med[drop:buf_n]
+        buf_n = keep
+    buf_t[buf_n:buf_n + n] = arr[:, 0] - start_time
+    buf_att[buf_n:buf_n + n] = arr[:, 1]
+    buf_med[buf_n:buf_n + n] = arr[:, 2]
+    buf_n += n
 
 fig, ax = plt.subplots()
 line_att, = ax.plot([], [], label="ATT", color="red")
@@ -122,20 +143,18 @@ ax.grid(True)
 start_time = time.time()
 
 def update(_):
-    while not eeg_queue.empty():
-        t, a, m = eeg_queue.get()
-        times.append(t - start_time)
-        att.append(a)
-        med.append(m)
+    n = len(eeg_queue)
+    if n:
+        push_samples([eeg_queue.popleft() for _ in range(n)])
 
-    if not times:
+    if not buf_n:
         return line_att, line_med
 
-    t0 = max(0, times[-1] - WINDOW_SEC)
+    t0 = max(0, buf_t[buf_n - 1] - WINDOW_SEC)
     ax.set_xlim(t0, t0 + WINDOW_SEC)
 
-    line_att.set_data(times, att)
-    line_med.set_data(times, med)
+    line_att.set_data(buf_t[:buf_n], buf_att[:buf_n])
+    line_med.set_data(buf_t[:buf_n], buf_med[:buf_n])
 
     return line_att, line_med
 